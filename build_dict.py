@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Build the offline Dutch dictionary used by the Dutch Word Analyzer.
+Reads the Kaikki.org (Wiktextract) Dutch JSONL dump and writes a DAWG
+mapping each word to its word type, meanings and forms.
+"""
+
+import json
+import sys
+from typing import Dict
+
+import dawg
+
+
+# Kaikki part-of-speech names and the word types used by the analyzer
+POS_TYPES = {
+    'verb': 'verb',
+    'noun': 'noun',
+    'adj': 'adjective',
+}
+
+# For each part of speech: (form name, tags the Kaikki form must carry)
+FORM_TAGS = {
+    'verb': (
+        ('past_tense', {'past', 'singular'}),
+        ('past_participle', {'past', 'participle'}),
+    ),
+    'noun': (
+        ('plural', {'plural'}),
+    ),
+    'adj': (
+        ('comparative', {'comparative'}),
+        ('superlative', {'superlative'}),
+    ),
+}
+
+MAX_MEANINGS = 10
+
+
+def parse_entry(entry: Dict) -> Dict:
+    """Convert one Kaikki entry to the analyzer's word info structure."""
+    pos = entry.get('pos')
+    info = {
+        'word_type': POS_TYPES.get(pos, pos),
+        'meanings': [],
+        'forms': {},
+    }
+
+    for sense in entry.get('senses', []):
+        for gloss in sense.get('glosses', []):
+            if gloss not in info['meanings']:
+                info['meanings'].append(gloss)
+
+    for form_name, required_tags in FORM_TAGS.get(pos, ()):
+        for form in entry.get('forms', []):
+            if required_tags <= set(form.get('tags', [])) and form.get('form', '-') != '-':
+                info['forms'][form_name] = form['form']
+                break
+
+    return info
+
+
+def merge_entry(words: Dict[str, Dict], word: str, info: Dict):
+    """Merge an entry into the dictionary; the first entry of a word decides its type."""
+    if word not in words:
+        words[word] = info
+        return
+    existing = words[word]
+    for meaning in info['meanings']:
+        if meaning not in existing['meanings']:
+            existing['meanings'].append(meaning)
+    for key, value in info['forms'].items():
+        existing['forms'].setdefault(key, value)
+
+
+def build_dict(input_file: str, output_file: str) -> int:
+    """Build the DAWG from a Kaikki JSONL dump. Returns the number of words."""
+    words = {}
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = json.loads(line)
+            word = entry.get('word', '').strip().lower()
+            if word and entry.get('lang_code', 'nl') == 'nl':
+                merge_entry(words, word, parse_entry(entry))
+
+    d = dawg.BytesDAWG(
+        (word, json.dumps({**info, 'meanings': info['meanings'][:MAX_MEANINGS]},
+                          ensure_ascii=False).encode('utf-8'))
+        for word, info in words.items()
+    )
+    d.save(output_file)
+    return len(words)
+
+
+def main():
+    """Main function."""
+    if len(sys.argv) < 2:
+        print("Usage: python build_dict.py <kaikki.org-dictionary-Dutch.jsonl> [nl.dawg]")
+        print("\nDownload the Dutch dump from https://kaikki.org/dictionary/Dutch/")
+        sys.exit(1)
+
+    input_file = sys.argv[1]
+    output_file = sys.argv[2] if len(sys.argv) > 2 else 'nl.dawg'
+
+    count = build_dict(input_file, output_file)
+    print(f"Wrote {count} words to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,157 @@ Dutch Word Analyzer - AI Agent
 Processes Dutch words from a text file and provides meanings and various forms.
 """
 
-import requests
-import json
-import time
+import ahocorasick
+import asyncio
+import httpx
+import orjson
+import sqlite3
 import sys
 import re
-from typing import Dict, List, Optional
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, TextIO
 from pathlib import Path
 
+from selectolax.lexbor import LexborHTMLParser
+from tqdm import tqdm
+
+try:
+    import dawg
+except ImportError:  # Only needed for the optional offline dictionary
+    dawg = None
+
+
+# Maximum number of words looked up concurrently (politeness limit for the APIs)
+MAX_CONCURRENCY = 10
+
+# HTTP/2 connection pool shared by all lookups; idle connections are kept alive between words
+POOL_SIZE = 20
+KEEPALIVE_TIMEOUT = 30  # seconds
+REQUEST_TIMEOUT = 5  # seconds
+
+# Transient HTTP failures are retried with exponential backoff
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2  # seconds, doubled on every retry
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Persistent cache of Wiktionary lookups, so repeated words skip the network
+CACHE_FILE = Path.home() / '.dutch_cache.sqlite'
+CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+
+# Optional offline dictionary built by build_dict.py; words found here need no network at all
+OFFLINE_DICT_FILE = Path(__file__).with_name('nl.dawg')
+
+# MediaWiki action API of the Dutch Wiktionary; one query resolves up to BATCH_SIZE titles
+NL_WIKTIONARY_API = 'https://nl.wiktionary.org/w/api.php'
+BATCH_SIZE = 50
+
+# Patterns for the wikitext of nl.wiktionary pages
+_LANGUAGE_RE = re.compile(r'\{\{=(\w+)=\}\}')
+_NLSTAM_RE = re.compile(r'\{\{-nlstam-\|([^|}]*)\|([^|}]*)\|([^|}]*)')
+_NLNOUN_RE = re.compile(r'\{\{-nlnoun-\|([^|}]*)\|([^|}]*)')
+_WIKILINK_RE = re.compile(r'\[\[(?:[^]|]*\|)?([^]]*)\]\]')
+
+# Section templates on nl.wiktionary and the word type they mark
+_WIKITEXT_TYPES = (
+    ('{{-verb-', 'verb'),
+    ('{{-noun-', 'noun'),
+    ('{{-adjc-', 'adjective'),
+)
+
+# Precompiled patterns for cleaning and parsing Wiktionary HTML
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Conjugation table row headers on nl.wiktionary and the form they hold
+_CONJUGATION_ROWS = {
+    'verleden tijd': 'past_tense',
+    'imperfectum': 'past_tense',
+    'voltooid deelwoord': 'past_participle',
+    'perfectum': 'past_participle',
+}
+
+# Regex fallback for pages without a parsable table.
+# Past tense in conjugation table - several patterns, tried in order
+_PAST_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in [
+    r'verleden tijd[^<]*?<td[^>]*>([^<]+)</td>',
+    r'imperfectum[^<]*?<td[^>]*>([^<]+)</td>',
+    r'<th[^>]*>verleden tijd</th>[^<]*?<td[^>]*>([^<]+)</td>',
+])
+
+# Past participle (voltooid deelwoord) in conjugation table
+_PARTICIPLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in [
+    r'voltooid deelwoord[^<]*?<td[^>]*>([^<]+)</td>',
+    r'perfectum[^<]*?<td[^>]*>([^<]+)</td>',
+    r'<th[^>]*>voltooid deelwoord</th>[^<]*?<td[^>]*>([^<]+)</td>',
+])
+
+
+# Plural endings of Dutch nouns by suffix; the longest matching suffix wins
+_NOUN_RULES = (
+    ('heid', 'en'),
+    ('ing', 'en'),
+    ('el', 's'),
+    ('er', 's'),
+    ('en', 's'),
+)
+
+# Dutch comparative: -er, superlative: -st
+_ADJECTIVE_ENDINGS = (
+    ('comparative', 'er'),
+    ('superlative', 'st'),
+)
+
+# Every form in a result, in output order
+_FORM_NAMES = ('past_tense', 'past_participle', 'present_tense',
+               'plural', 'comparative', 'superlative')
+
+# Forms that make sense for each word type; all other forms are cleared
+_ALLOWED_FORMS = {
+    'verb': frozenset({'past_tense', 'past_participle', 'present_tense'}),
+    'noun': frozenset({'plural'}),
+    'adjective': frozenset({'comparative', 'superlative'}),
+}
+
+# Stem-final consonants after which weak verbs take -te/-t instead of -de/-d ('t kofschip)
+_VOICELESS = frozenset('ptkfsxc')
+
+
+def _build_suffix_automaton(rules) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton over the reversed suffixes of (suffix, value) rules."""
+    automaton = ahocorasick.Automaton()
+    for suffix, value in rules:
+        automaton.add_word(suffix[::-1], (suffix, value))
+    automaton.make_automaton()
+    return automaton
+
+
+def _classify_by_suffix(automaton: ahocorasick.Automaton, word: str):
+    """Return the value of the longest rule suffix that `word` ends with, or None."""
+    match = None
+    # Walk the reversed word once; hits starting at its first character are suffixes
+    # of the word, and they are reported shortest first
+    for end, (suffix, value) in automaton.iter(word[::-1]):
+        if end + 1 == len(suffix):
+            match = value
+    return match
+
+
+_NOUN_SUFFIXES = _build_suffix_automaton(_NOUN_RULES)
+
+
+def _iter_words(f: TextIO) -> Iterator[str]:
+    """Lazily yield the non-empty, stripped lines of a words file."""
+    return (word for line in f if (word := line.strip()))
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Split an iterable into lists of at most `size` items, without materializing it."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
 
 class DutchWordAnalyzer:
     """AI agent to analyze Dutch words and provide meanings and forms."""
@@ -50,37 +193,247 @@ class DutchWordAnalyzer:
     }
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip'
+        }
+        self.limits = httpx.Limits(max_connections=POOL_SIZE,
+                                   max_keepalive_connections=POOL_SIZE,
+                                   keepalive_expiry=KEEPALIVE_TIMEOUT)
         self.base_url = "https://api.woordenboek.nl/api/v1"
+        self._db = sqlite3.connect(CACHE_FILE)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS cache (word TEXT PRIMARY KEY, payload TEXT, ts INTEGER)'
+        )
+        self._dawg = None
+        if dawg is not None and OFFLINE_DICT_FILE.exists():
+            self._dawg = dawg.BytesDAWG()
+            self._dawg.load(str(OFFLINE_DICT_FILE))
         
     def get_word_info(self, word: str) -> Dict:
         """
         Get word information including meaning and forms.
+        Synchronous wrapper around the async lookup, kept for single-word use.
+        """
+        word_info = asyncio.run(self._process_all([word]))[0]
+        word_info.pop('_is_irregular', None)
+        word_info.pop('_failed', None)
+        return word_info
+    
+    async def _process_all(self, words: List[str]) -> List[Dict]:
+        """Fetch information for all words concurrently."""
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        async with self._make_client() as client:
+            return await self._fetch_batch(client, sem, words)
+    
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create the HTTP/2 client shared by all lookups of a run."""
+        return httpx.AsyncClient(http2=True, headers=self.headers, limits=self.limits,
+                                 timeout=REQUEST_TIMEOUT)
+    
+    async def _fetch_batch(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                           words: List[str], progress: Optional[tqdm] = None) -> List[Dict]:
+        """
+        Fetch information for a batch of words concurrently.
+        Advances `progress`, if given, as each word resolves.
+        """
+        # Look every word up locally once, then resolve the nl.wiktionary pages
+        # of the remaining words in a few batched queries
+        local = {w: self._lookup_local(w) for w in dict.fromkeys(w.strip().lower() for w in words) if w}
+        pending = [w for w, word_info in local.items() if word_info is None]
+        prefetched = await self._batch_fetch_wiktionary(client, pending)
+        
+        async def fetch(word: str) -> Dict:
+            try:
+                return await self._fetch_word(client, sem, word, local, prefetched)
+            finally:
+                if progress is not None:
+                    progress.update()
+        
+        # All cache writes of this batch go into a single transaction
+        with self._db:
+            fetched = await asyncio.gather(*[fetch(w) for w in words], return_exceptions=True)
+        
+        results = []
+        for word, word_info in zip(words, fetched):
+            if isinstance(word_info, Exception):
+                tqdm.write(f"  Warning: Could not look up '{word}': {word_info}", file=sys.stderr)
+                word_info = self._empty_result(word.strip().lower())
+                # Not saved as done, so a resumed run looks the word up again
+                word_info['_failed'] = True
+            results.append(word_info)
+        return results
+    
+    def _empty_result(self, word: str) -> Dict:
+        """Create an empty result structure for a word."""
+        return {
+            'word': word,
+            'meanings': [],
+            'forms': dict.fromkeys(_FORM_NAMES),
+            'word_type': None
+        }
+    
+    def _offline_get(self, word: str) -> Optional[Dict]:
+        """Return the word from the offline dictionary, or None if not available."""
+        if self._dawg is None:
+            return None
+        values = self._dawg.get(word)
+        if not values:
+            return None
+        entry = orjson.loads(values[0])
+        result = self._empty_result(word)
+        result['word_type'] = entry.get('word_type')
+        result['meanings'] = entry.get('meanings', [])
+        result['forms'].update(entry.get('forms', {}))
+        return result
+    
+    def _lookup_local(self, word: str) -> Optional[Dict]:
+        """Look up a word without the network: offline dictionary first, then the cache."""
+        return self._offline_get(word) or self._cache_get(word)
+    
+    def _cache_get(self, word: str) -> Optional[Dict]:
+        """Return the cached lookup for a word, or None if missing or expired."""
+        row = self._db.execute(
+            'SELECT payload FROM cache WHERE word = ? AND ts > ?',
+            (word, int(time.time()) - CACHE_TTL)
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+    
+    def _cache_put(self, word: str, word_info: Dict):
+        """Store the lookup for a word in the cache."""
+        self._db.execute(
+            'INSERT OR REPLACE INTO cache (word, payload, ts) VALUES (?, ?, ?)',
+            (word, orjson.dumps(word_info).decode('utf-8'), int(time.time()))
+        )
+    
+    async def _get(self, client: httpx.AsyncClient, url: str, as_json: bool = True,
+                   data: Optional[Dict] = None):
+        """
+        GET a URL (or POST form data to it), retrying transient failures.
+        Returns the body, or None if unavailable. Connection and read errors
+        are retried too, and re-raised once the last attempt fails.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                if data is None:
+                    response = await client.get(url)
+                else:
+                    response = await client.post(url, data=data)
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code == 200:
+                    return orjson.loads(response.content) if as_json else response.text
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return None
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _batch_fetch_wiktionary(self, client: httpx.AsyncClient,
+                                      words: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch the nl.wiktionary wikitext of many words with one API query per BATCH_SIZE words.
+        Returns {word: parsed page}, with an empty dict for words without a page.
+        Words of a batch that failed are left out, so their lookup falls back to the HTML page.
+        """
+        pages = {}
+        for i in range(0, len(words), BATCH_SIZE):
+            batch = words[i:i + BATCH_SIZE]
+            try:
+                data = await self._get(client, NL_WIKTIONARY_API, data={
+                    'action': 'query',
+                    'format': 'json',
+                    'formatversion': '2',
+                    'prop': 'revisions',
+                    'rvprop': 'content',
+                    'rvslots': 'main',
+                    'titles': '|'.join(batch),
+                })
+            except Exception as e:
+                tqdm.write(f"  Warning: Could not fetch batch from Wiktionary: {e}", file=sys.stderr)
+                continue
+            if not data or 'query' not in data:
+                continue
+            
+            for word in batch:
+                pages[word] = {}
+            # Pages come back under their normalized titles (e.g. "a_b" becomes "a b"),
+            # so map each title back to the words that were asked for
+            requested = {word: [word] for word in batch}
+            for norm in data['query'].get('normalized', []):
+                requested.setdefault(norm['to'], []).append(norm['from'])
+            for page in data['query'].get('pages', []):
+                revisions = page.get('revisions')
+                if revisions:
+                    wikitext = revisions[0]['slots']['main'].get('content', '')
+                    parsed = self._parse_wikitext(wikitext)
+                    for word in requested.get(page['title'], ()):
+                        pages[word] = parsed
+        return pages
+    
+    @staticmethod
+    def _parse_wikitext(wikitext: str) -> Dict:
+        """Extract word type and forms from the Dutch section of a nl.wiktionary page."""
+        # Keep only the Dutch section ({{=nld=}} up to the next language header)
+        section = None
+        languages = list(_LANGUAGE_RE.finditer(wikitext))
+        for i, match in enumerate(languages):
+            if match.group(1) == 'nld':
+                end = languages[i + 1].start() if i + 1 < len(languages) else len(wikitext)
+                section = wikitext[match.end():end]
+                break
+        if section is None:
+            return {}
+        
+        def clean(value: str) -> Optional[str]:
+            value = _WIKILINK_RE.sub(r'\1', value).strip()
+            return value if value and value != '-' else None
+        
+        result = {'word_type': None, 'forms': {}}
+        for template, word_type in _WIKITEXT_TYPES:
+            if template in section:
+                result['word_type'] = word_type
+                break
+        
+        # Verb stem forms: {{-nlstam-|infinitive|past tense|past participle}}
+        stam = _NLSTAM_RE.search(section)
+        if stam:
+            result['forms']['past_tense'] = clean(stam.group(2))
+            result['forms']['past_participle'] = clean(stam.group(3))
+        
+        # Noun forms: {{-nlnoun-|singular|plural|...}}
+        noun = _NLNOUN_RE.search(section)
+        if noun:
+            result['forms']['plural'] = clean(noun.group(2))
+        
+        return result
+    
+    async def _fetch_word(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                          word: str, local: Dict[str, Optional[Dict]],
+                          prefetched: Dict[str, Dict]) -> Dict:
+        """
+        Get word information including meaning and forms.
         Uses multiple sources for comprehensive data.
+        `local` holds the offline dictionary / cache hits already looked up for the batch.
         """
         word = word.strip().lower()
         if not word:
             return {}
+        
+        # Decided once here and carried along, so later steps need not look it up again
+        is_irregular = word in self.IRREGULAR_VERBS
+        
+        cached = local.get(word)
+        if cached is not None:
+            cached['_is_irregular'] = is_irregular
+            return cached
             
-        result = {
-            'word': word,
-            'meanings': [],
-            'forms': {
-                'past_tense': None,
-                'past_participle': None,
-                'present_tense': None,
-                'plural': None,
-                'comparative': None,
-                'superlative': None
-            },
-            'word_type': None
-        }
+        result = self._empty_result(word)
         
         # Try to get information from Wiktionary
-        wiktionary_data = self._get_wiktionary_info(word)
+        async with sem:
+            wiktionary_data = await self._get_wiktionary_info(client, word, is_irregular,
+                                                              prefetched.get(word))
         if wiktionary_data:
             result.update(wiktionary_data)
         
@@ -96,14 +449,23 @@ class DutchWordAnalyzer:
                 if not result['forms'][key] and woordenboek_data.get('forms', {}).get(key):
                     result['forms'][key] = woordenboek_data['forms'][key]
         
+        # Only cache successful lookups, so network failures are retried next run
+        if wiktionary_data or woordenboek_data:
+            self._cache_put(word, result)
+        
+        result['_is_irregular'] = is_irregular
         return result
     
-    def _get_wiktionary_info(self, word: str) -> Optional[Dict]:
-        """Get word information from Wiktionary."""
+    async def _get_wiktionary_info(self, client: httpx.AsyncClient, word: str,
+                                   is_irregular: bool, page: Optional[Dict]) -> Optional[Dict]:
+        """
+        Get word information from Wiktionary.
+        `page` is the prefetched nl.wiktionary entry, or None if it was not prefetched.
+        """
         try:
             # Try to get definitions
             url = f"https://en.wiktionary.org/api/rest_v1/page/definition/{word}"
-            response = self.session.get(url, timeout=5)
+            data = await self._get(client, url)
             
             result = {
                 'meanings': [],
@@ -111,9 +473,7 @@ class DutchWordAnalyzer:
                 'word_type': None
             }
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if data:
                 # Extract Dutch definitions
                 if 'nl' in data:
                     nl_data = data['nl']
@@ -128,7 +488,7 @@ class DutchWordAnalyzer:
                                 if 'definition' in definition:
                                     meaning = definition['definition']
                                     # Clean HTML tags from meaning
-                                    meaning = re.sub(r'<[^>]+>', '', meaning)
+                                    meaning = _HTML_TAG_RE.sub('', meaning)
                                     meaning = meaning.strip()
                                     if meaning:
                                         result['meanings'].append(meaning)
@@ -136,10 +496,9 @@ class DutchWordAnalyzer:
             # Try to get inflections/forms from a different endpoint
             try:
                 inflections_url = f"https://en.wiktionary.org/api/rest_v1/page/inflections/{word}"
-                infl_response = self.session.get(inflections_url, timeout=5)
-                if infl_response.status_code == 200:
+                infl_data = await self._get(client, inflections_url)
+                if infl_data:
                     try:
-                        infl_data = infl_response.json()
                         if 'nl' in infl_data:
                             nl_infl = infl_data['nl']
                             for entry in nl_infl:
@@ -171,11 +530,13 @@ class DutchWordAnalyzer:
                                                 result['forms']['superlative'] = infl_word
                     except:
                         pass
+            except httpx.TransportError:
+                raise
             except:
                 pass  # Inflections endpoint might not be available
             
             # Check if it's a known irregular verb (check this early)
-            if word in self.IRREGULAR_VERBS:
+            if is_irregular:
                 past_tense, past_participle = self.IRREGULAR_VERBS[word]
                 # Set word type to verb if not already set
                 if not result.get('word_type'):
@@ -184,62 +545,92 @@ class DutchWordAnalyzer:
                 result['forms']['past_tense'] = past_tense
                 result['forms']['past_participle'] = past_participle
             
-            # Try to parse the actual Wiktionary page HTML for conjugation tables
-            try:
-                page_url = f"https://nl.wiktionary.org/wiki/{word}"
-                page_response = self.session.get(page_url, timeout=5)
-                if page_response.status_code == 200:
-                    html_content = page_response.text
-                    # Look for past tense in conjugation table - more flexible pattern
-                    # Try multiple patterns
-                    patterns = [
-                        r'verleden tijd[^<]*?<td[^>]*>([^<]+)</td>',
-                        r'imperfectum[^<]*?<td[^>]*>([^<]+)</td>',
-                        r'<th[^>]*>verleden tijd</th>[^<]*?<td[^>]*>([^<]+)</td>',
-                    ]
-                    for pattern in patterns:
-                        past_tense_match = re.search(pattern, html_content, re.IGNORECASE | re.DOTALL)
-                        if past_tense_match and not result['forms'].get('past_tense'):
-                            past_form = past_tense_match.group(1).strip()
-                            # Clean up the form
-                            past_form = re.sub(r'<[^>]+>', '', past_form)  # Remove any HTML tags
-                            past_form = re.sub(r'\s+', ' ', past_form).split()[0] if past_form else None
-                            if past_form and len(past_form) > 1:
-                                result['forms']['past_tense'] = past_form
-                                break
-                    
-                    # Look for past participle (voltooid deelwoord)
-                    part_patterns = [
-                        r'voltooid deelwoord[^<]*?<td[^>]*>([^<]+)</td>',
-                        r'perfectum[^<]*?<td[^>]*>([^<]+)</td>',
-                        r'<th[^>]*>voltooid deelwoord</th>[^<]*?<td[^>]*>([^<]+)</td>',
-                    ]
-                    for pattern in part_patterns:
-                        participle_match = re.search(pattern, html_content, re.IGNORECASE | re.DOTALL)
-                        if participle_match and not result['forms'].get('past_participle'):
-                            part_form = participle_match.group(1).strip()
-                            part_form = re.sub(r'<[^>]+>', '', part_form)
-                            part_form = re.sub(r'\s+', ' ', part_form).split()[0] if part_form else None
-                            if part_form and len(part_form) > 1:
-                                result['forms']['past_participle'] = part_form
-                                break
-            except Exception as e:
-                pass  # HTML parsing might fail
+            # Use the forms from the prefetched nl.wiktionary wikitext
+            if page:
+                if not result.get('word_type'):
+                    result['word_type'] = page['word_type']
+                for key, value in page['forms'].items():
+                    if value and not result['forms'].get(key):
+                        result['forms'][key] = value
+            
+            # Only if the batch query missed this word and the verb forms are still
+            # incomplete, parse the actual page HTML for conjugation tables
+            needs_html = not (result['forms'].get('past_tense')
+                              and result['forms'].get('past_participle'))
+            if page is None and needs_html:
+                try:
+                    page_url = f"https://nl.wiktionary.org/wiki/{word}"
+                    html_content = await self._get(client, page_url, as_json=False)
+                    if html_content:
+                        table_forms = self._parse_conjugation_table(html_content)
+                        if not table_forms:
+                            # No usable table rows found - fall back to scanning the raw HTML
+                            table_forms = self._parse_conjugation_regex(html_content)
+                        for key, value in table_forms.items():
+                            if not result['forms'].get(key):
+                                result['forms'][key] = value
+                except httpx.TransportError:
+                    raise
+                except Exception as e:
+                    pass  # HTML parsing might fail
             
             return result if result['meanings'] or any(result['forms'].values()) else None
+        except httpx.TransportError:
+            raise  # The lookup failed, not the word: let the caller retry it next run
         except Exception as e:
-            print(f"  Warning: Could not fetch from Wiktionary: {e}", file=sys.stderr)
+            tqdm.write(f"  Warning: Could not fetch from Wiktionary: {e}", file=sys.stderr)
         
         return None
     
+    @staticmethod
+    def _clean_form(text: str) -> Optional[str]:
+        """Reduce a table cell to a single word form, or None if nothing usable."""
+        text = _HTML_TAG_RE.sub('', text).strip()  # Remove any HTML tags
+        text = _WS_RE.sub(' ', text).split()[0] if text else None
+        return text if text and len(text) > 1 else None
+    
+    def _parse_conjugation_table(self, html_content: str) -> Dict:
+        """Extract verb forms from the conjugation table rows in a single parser pass."""
+        forms = {}
+        tree = LexborHTMLParser(html_content)
+        for row in tree.css('table tr'):
+            header = row.css_first('th')
+            cell = row.css_first('td')
+            if header is None or cell is None:
+                continue
+            key = _CONJUGATION_ROWS.get(header.text().lower().strip())
+            if key and key not in forms:
+                form = self._clean_form(cell.text())
+                if form:
+                    forms[key] = form
+        return forms
+    
+    def _parse_conjugation_regex(self, html_content: str) -> Dict:
+        """Extract verb forms by scanning the raw HTML with regexes."""
+        forms = {}
+        for key, patterns in (('past_tense', _PAST_PATTERNS),
+                              ('past_participle', _PARTICIPLE_PATTERNS)):
+            for pattern in patterns:
+                match = pattern.search(html_content)
+                form = self._clean_form(match.group(1)) if match else None
+                if form:
+                    forms[key] = form
+                    break
+        return forms
+    
     def _get_woordenboek_info(self, word: str) -> Optional[Dict]:
         """Get word information from Woordenboek.nl (fallback method)."""
         # This is a placeholder - you might need to use a different API
         # or implement web scraping if needed
         return None
     
-    def _get_verb_forms(self, word: str) -> Dict:
-        """Get verb forms (conjugations) for Dutch verbs."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_verb_forms(word: str) -> Dict:
+        """
+        Get verb forms (conjugations) for Dutch verbs.
+        Results are memoized, so callers must not mutate the returned dict.
+        """
         forms = {}
         
         # Common Dutch verb patterns
@@ -254,7 +645,7 @@ class DutchWordAnalyzer:
                 
                 # Dutch spelling rule: if stem ends in voiceless consonant (p, t, k, f, s, ch), use -te
                 # Otherwise use -de
-                voiceless = final_cons in ['p', 't', 'k', 'f', 's', 'x', 'c']
+                voiceless = final_cons in _VOICELESS
                 
                 # Past tense (simple past, singular)
                 if voiceless:
@@ -270,129 +661,138 @@ class DutchWordAnalyzer:
         
         return forms
     
-    def _get_noun_forms(self, word: str) -> Dict:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_noun_forms(word: str) -> Dict:
         """Get noun forms (plural) for Dutch nouns."""
-        forms = {}
-        
         # Common Dutch plural patterns
-        if word.endswith('el') or word.endswith('er') or word.endswith('en'):
-            forms['plural'] = word + 's'
-        elif word.endswith('heid'):
-            forms['plural'] = word + 'en'
-        elif word.endswith('ing'):
-            forms['plural'] = word + 'en'
-        else:
-            forms['plural'] = word + 'en'  # Most common pattern
-        
-        return forms
+        ending = _classify_by_suffix(_NOUN_SUFFIXES, word)
+        return {'plural': word + (ending or 'en')}  # -en is the most common pattern
     
-    def _get_adjective_forms(self, word: str) -> Dict:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_adjective_forms(word: str) -> Dict:
         """Get adjective forms (comparative and superlative) for Dutch adjectives."""
-        forms = {}
-        
-        # Dutch comparative: -er, superlative: -st
         # For most adjectives ending in a consonant
-        if len(word) > 2:
-            # Comparative
-            forms['comparative'] = word + 'er'
-            
-            # Superlative
-            if word.endswith('r'):
-                forms['superlative'] = word + 'st'
-            else:
-                forms['superlative'] = word + 'st'
-        
-        return forms
+        if len(word) <= 2:
+            return {}
+        return {form: word + ending for form, ending in _ADJECTIVE_ENDINGS}
     
-    def process_words_from_file(self, file_path: str) -> List[Dict]:
-        """Process words from a text file (one word per line)."""
+    def process_words_from_file(self, file_path: str, output_file: Optional[str] = None) -> List[Dict]:
+        """
+        Process words from a text file (one word per line).
+        If output_file is given, each analyzed word is appended to it as a JSON line right away.
+        Words already in an existing output file are skipped, so an interrupted run can be resumed.
+        """
         words_file = Path(file_path)
         
         if not words_file.exists():
             print(f"Error: File '{file_path}' not found.", file=sys.stderr)
             return []
         
-        # Read words from file
-        with open(words_file, 'r', encoding='utf-8') as f:
-            words = [line.strip() for line in f if line.strip()]
-        
-        print(f"Found {len(words)} words to process...\n")
+        done = set()
+        if output_file:
+            if not self._is_jsonl_file(output_file):
+                print(f"Error: '{output_file}' is not a JSON Lines file; "
+                      f"choose a new output file.", file=sys.stderr)
+                return []
+            self._truncate_partial_line(output_file)
+            done = self._load_done_words(output_file)
+        if done:
+            print(f"Skipping {len(done)} words already in '{output_file}'.")
+        print(f"Processing words from '{file_path}'...\n")
         
+        # Stream words from the file instead of reading it all up front
+        with open(words_file, 'r', encoding='utf-8') as f:
+            words = (w for w in _iter_words(f) if w.lower() not in done)
+            if not output_file:
+                return asyncio.run(self._process_stream(words))
+            with open(output_file, 'ab') as outfh:
+                return asyncio.run(self._process_stream(words, outfh))
+    
+    @staticmethod
+    def _is_jsonl_file(output_file: str) -> bool:
+        """
+        Whether an output file can be resumed: missing, empty or one JSON object per line.
+        Guards older JSON array output files against being truncated or appended to.
+        """
+        if not Path(output_file).exists():
+            return True
+        with open(output_file, 'rb') as f:
+            first = f.readline()
+        if not first.endswith(b'\n'):
+            # Empty, or a single line cut short by an interrupted run
+            return not first or first.startswith(b'{')
+        try:
+            return isinstance(orjson.loads(first), dict)
+        except orjson.JSONDecodeError:
+            return False
+    
+    @staticmethod
+    def _truncate_partial_line(output_file: str):
+        """
+        Cut off a last line left unfinished by an interrupted run, so that
+        appended records start on a line of their own.
+        """
+        if not Path(output_file).exists():
+            return
+        with open(output_file, 'rb+') as f:
+            size = f.seek(0, 2)
+            # Scan backwards in blocks for the last newline
+            end = size
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b'\n')
+                if newline != -1:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end != size:
+                f.truncate(end)
+    
+    @staticmethod
+    def _load_done_words(output_file: str) -> Set[str]:
+        """Return the words already saved in a JSON Lines output file."""
+        done = set()
+        if not Path(output_file).exists():
+            return done
+        with open(output_file, 'rb') as f:
+            for line in f:
+                try:
+                    done.add(orjson.loads(line)['word'])
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    pass  # E.g. a line cut short by an interrupted run
+        return done
+    
+    async def _process_stream(self, words: Iterator[str],
+                              outfh: Optional[BinaryIO] = None) -> List[Dict]:
+        """
+        Look up words chunk by chunk, sharing one HTTP client across all chunks.
+        Each newly analyzed word is written to `outfh` as a JSON line, if given;
+        words whose lookup failed are left out so a resumed run tries them again.
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
         results = []
-        for i, word in enumerate(words, 1):
-            print(f"Processing [{i}/{len(words)}]: {word}...", end=' ', flush=True)
-            word_info = self.get_word_info(word)
-            
-            # If no API data, try to infer forms based on word patterns
-            # Determine word type first, then only add appropriate forms
-            word_type = word_info.get('word_type', '').lower()
-            
-            # Don't use pattern-based inference if it's a known irregular verb
-            is_irregular = word in self.IRREGULAR_VERBS
-            
-            if not word_type or not any(word_info['forms'].values()):
-                # Try to infer verb forms (but skip if it's irregular - already handled)
-                if not is_irregular:
-                    verb_forms = self._get_verb_forms(word)
-                    if verb_forms and any(verb_forms.values()):
-                        if not word_type:
-                            word_type = 'verb'
-                            word_info['word_type'] = 'verb'
-                        if word_type == 'verb':
-                            for key, value in verb_forms.items():
-                                if not word_info['forms'].get(key):
-                                    word_info['forms'][key] = value
-                elif is_irregular and not word_type:
-                    # Mark as verb if it's irregular
-                    word_type = 'verb'
-                    word_info['word_type'] = 'verb'
-                
-                # Try to infer noun forms
-                noun_forms = self._get_noun_forms(word)
-                if noun_forms and not word_type:
-                    word_type = 'noun'
-                    word_info['word_type'] = 'noun'
-                if word_type == 'noun':
-                    if noun_forms and not word_info['forms'].get('plural'):
-                        word_info['forms']['plural'] = noun_forms.get('plural')
-                
-                # Try to infer adjective forms
-                adj_forms = self._get_adjective_forms(word)
-                if adj_forms and not word_type:
-                    word_type = 'adjective'
-                    word_info['word_type'] = 'adjective'
-                if word_type == 'adjective':
-                    for key, value in adj_forms.items():
-                        if not word_info['forms'].get(key):
-                            word_info['forms'][key] = value
-            
-            # Clean up inappropriate forms based on word type
-            word_type = word_info.get('word_type', '').lower()
-            if word_type == 'verb':
-                # Verbs should not have comparative, superlative, or plural
-                word_info['forms']['comparative'] = None
-                word_info['forms']['superlative'] = None
-                word_info['forms']['plural'] = None
-            elif word_type == 'adjective':
-                # Adjectives should not have past_tense, past_participle, present_tense, or plural
-                word_info['forms']['past_tense'] = None
-                word_info['forms']['past_participle'] = None
-                word_info['forms']['present_tense'] = None
-                word_info['forms']['plural'] = None
-            elif word_type == 'noun':
-                # Nouns should not have verb forms or adjective forms
-                word_info['forms']['past_tense'] = None
-                word_info['forms']['past_participle'] = None
-                word_info['forms']['present_tense'] = None
-                word_info['forms']['comparative'] = None
-                word_info['forms']['superlative'] = None
-            
-            results.append(word_info)
-            print("✓")
-            
-            # Be polite to APIs
-            time.sleep(0.5)
-        
+        # Analyzed words by normalized form, so duplicates and case variants are looked up once
+        by_word = {}
+        with tqdm(unit='word') as progress:
+            async with self._make_client() as client:
+                for chunk in _chunked(words, BATCH_SIZE):
+                    unique = list(dict.fromkeys(w.lower() for w in chunk if w.lower() not in by_word))
+                    fetched = await self._fetch_batch(client, sem, unique, progress)
+                    for word, word_info in zip(unique, fetched):
+                        word_info = _finalize_word_info(word, word_info)
+                        by_word[word] = word_info
+                        failed = word_info.pop('_failed', False)
+                        if outfh and not failed:
+                            outfh.write(orjson.dumps(word_info) + b'\n')
+                    if outfh:
+                        outfh.flush()
+                    
+                    # Repeated words were not fetched again, count them as done now
+                    progress.update(len(chunk) - len(unique))
+                    results.extend(by_word[word.lower()] for word in chunk)
         return results
     
     def display_results(self, results: List[Dict]):
@@ -439,7 +839,7 @@ class DutchWordAnalyzer:
                 if valid_forms.get('superlative'):
                     print(f"  Superlative: {valid_forms['superlative']}")
                 # Note about irregular verbs
-                if word_info.get('word_type', '').lower() == 'verb' and not valid_forms.get('past_tense'):
+                if (word_info.get('word_type') or '').lower() == 'verb' and not valid_forms.get('past_tense'):
                     print("  Note: This may be an irregular verb - forms may need verification")
             else:
                 print("Forms: (Not found - may need manual lookup)")
@@ -447,32 +847,88 @@ class DutchWordAnalyzer:
             print()
     
     def save_results(self, results: List[Dict], output_file: str):
-        """Save results to a JSON file."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        """
+        Save results to a JSON Lines file (one word per line).
+        process_words_from_file already does this incrementally when given an output file.
+        """
+        with open(output_file, 'wb') as f:
+            for word_info in results:
+                f.write(orjson.dumps(word_info, option=orjson.OPT_NON_STR_KEYS) + b'\n')
         print(f"\nResults saved to: {output_file}")
 
 
+def _finalize_word_info(word: str, word_info: Dict) -> Dict:
+    """Fill in missing forms from word patterns and drop forms that do not fit the word type."""
+    # If no API data, try to infer forms based on word patterns
+    # Determine word type first, then only add appropriate forms
+    wt = (word_info.get('word_type') or '').lower()
+    forms = word_info['forms']
+    
+    # Don't use pattern-based inference if it's a known irregular verb
+    is_irregular = word_info.pop('_is_irregular', False)
+    
+    if not wt or not any(forms.values()):
+        # Try to infer verb forms (but skip if it's irregular - already handled)
+        if not is_irregular:
+            verb_forms = DutchWordAnalyzer._get_verb_forms(word)
+            if verb_forms and any(verb_forms.values()):
+                if not wt:
+                    wt = 'verb'
+                if wt == 'verb':
+                    for key, value in verb_forms.items():
+                        if not forms.get(key):
+                            forms[key] = value
+        elif not wt:
+            # Mark as verb if it's irregular
+            wt = 'verb'
+        
+        # Try to infer noun forms
+        noun_forms = DutchWordAnalyzer._get_noun_forms(word)
+        if noun_forms and not wt:
+            wt = 'noun'
+        if wt == 'noun':
+            if noun_forms and not forms.get('plural'):
+                forms['plural'] = noun_forms.get('plural')
+        
+        # Try to infer adjective forms
+        adj_forms = DutchWordAnalyzer._get_adjective_forms(word)
+        if adj_forms and not wt:
+            wt = 'adjective'
+        if wt == 'adjective':
+            for key, value in adj_forms.items():
+                if not forms.get(key):
+                    forms[key] = value
+    
+    # Clean up inappropriate forms based on word type
+    # Every result carries the full set of form keys, whatever its source
+    allowed = _ALLOWED_FORMS.get(wt)
+    word_info['forms'] = {k: (forms.get(k) if allowed is None or k in allowed else None)
+                          for k in _FORM_NAMES}
+    
+    word_info['word_type'] = wt or None
+    return word_info
+
+
 def main():
     """Main function."""
     if len(sys.argv) < 2:
-        print("Usage: python dutch_word_analyzer.py <words_file.txt> [output.json]")
+        print("Usage: python dutch_word_analyzer.py <words_file.txt> [output.jsonl]")
         print("\nExample:")
         print("  python dutch_word_analyzer.py words.txt")
-        print("  python dutch_word_analyzer.py words.txt output.json")
+        print("  python dutch_word_analyzer.py words.txt output.jsonl")
         sys.exit(1)
     
     words_file = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else None
     
     analyzer = DutchWordAnalyzer()
-    results = analyzer.process_words_from_file(words_file)
+    results = analyzer.process_words_from_file(words_file, output_file)
     
     if results:
         analyzer.display_results(results)
         
         if output_file:
-            analyzer.save_results(results, output_file)
+            print(f"\nResults saved to: {output_file}")
     else:
         print("No words processed.")
 
@@ -0,0 +1,231 @@
+"""Regression checks for the Dutch Word Analyzer (no network access needed)."""
+
+import asyncio
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import orjson
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import dutch_word_analyzer  # noqa: E402
+from dutch_word_analyzer import DutchWordAnalyzer  # noqa: E402
+
+
+DEFINITION_API = 'https://en.wiktionary.org/api/rest_v1/page/definition/'
+
+# Shaped like the en.wiktionary REST definition of "lezen"
+DEFINITION = {
+    'nl': [{
+        'partOfSpeech': 'Verb',
+        'definitions': [
+            {'definition': '(<i>transitive, intransitive</i>) to <a href="/wiki/read">read</a>'},
+            {'definition': '(<i>transitive</i>) to gather, to pick'},
+        ],
+    }],
+    'de': [{'partOfSpeech': 'Verb', 'definitions': [{'definition': 'to read'}]}],
+}
+
+
+# Shaped like the nl.wiktionary wikitext of "lopen", with a section of another language after it
+WIKITEXT = '''{{=nld=}}
+{{-verb-|nld}}
+{{-nlstam-|[[lopen]]|[[liep]]|[[gelopen]]}}
+{{-noun-|nld}}
+{{-nlnoun-|loop|-}}
+{{=fry=}}
+{{-nlnoun-|loop|lopen}}'''
+
+
+class ParseWikitextTest(unittest.TestCase):
+    """_parse_wikitext reads the Dutch section of a nl.wiktionary page."""
+
+    def test_dutch_section_forms(self):
+        result = DutchWordAnalyzer._parse_wikitext(WIKITEXT)
+
+        self.assertEqual(result['word_type'], 'verb')
+        self.assertEqual(result['forms'], {'past_tense': 'liep',
+                                           'past_participle': 'gelopen',
+                                           'plural': None})
+
+    def test_page_without_dutch_section(self):
+        self.assertEqual(DutchWordAnalyzer._parse_wikitext('{{=fry=}}\n{{-verb-|fry}}'), {})
+
+
+class BatchFetchWiktionaryTest(unittest.TestCase):
+    """_batch_fetch_wiktionary with the network replaced by a canned query result."""
+
+    def setUp(self):
+        with mock.patch.object(dutch_word_analyzer, 'CACHE_FILE', ':memory:'):
+            self.analyzer = DutchWordAnalyzer()
+
+    def test_normalized_titles_map_back_to_words(self):
+        response = {'query': {
+            'normalized': [{'from': 'te_lopen', 'to': 'te lopen'}],
+            'pages': [
+                {'title': 'lopen', 'revisions': [{'slots': {'main': {'content': WIKITEXT}}}]},
+                {'title': 'te lopen', 'revisions': [{'slots': {'main': {'content': WIKITEXT}}}]},
+                {'title': 'xyzzy', 'missing': True},
+            ],
+        }}
+
+        async def fake_get(client, url, as_json=True, data=None):
+            return response
+
+        with mock.patch.object(self.analyzer, '_get', side_effect=fake_get):
+            pages = asyncio.run(self.analyzer._batch_fetch_wiktionary(
+                None, ['lopen', 'te_lopen', 'xyzzy']))
+
+        self.assertEqual(set(pages), {'lopen', 'te_lopen', 'xyzzy'})
+        self.assertEqual(pages['te_lopen']['forms']['past_tense'], 'liep')
+        self.assertEqual(pages['xyzzy'], {})
+
+
+class GetWiktionaryInfoTest(unittest.TestCase):
+    """_get_wiktionary_info with the network replaced by canned responses."""
+
+    def setUp(self):
+        with mock.patch.object(dutch_word_analyzer, 'CACHE_FILE', ':memory:'):
+            self.analyzer = DutchWordAnalyzer()
+
+    def run_lookup(self, responses, page):
+        async def fake_get(client, url, as_json=True, data=None):
+            for prefix, body in responses.items():
+                if url.startswith(prefix):
+                    return body
+            return None
+
+        with mock.patch.object(self.analyzer, '_get', side_effect=fake_get):
+            return asyncio.run(self.analyzer._get_wiktionary_info(None, 'lezen', False, page))
+
+    def test_definition_does_not_replace_prefetched_page(self):
+        responses = {DEFINITION_API: DEFINITION}
+        page = {'word_type': 'verb', 'forms': {'past_tense': 'las', 'past_participle': 'gelezen'}}
+
+        result = self.run_lookup(responses, page)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result['word_type'], 'Verb')
+        self.assertEqual(result['meanings'], ['(transitive, intransitive) to read',
+                                              '(transitive) to gather, to pick'])
+        self.assertEqual(result['forms']['past_tense'], 'las')
+        self.assertEqual(result['forms']['past_participle'], 'gelezen')
+
+    def test_html_fallback_runs_when_page_was_not_prefetched(self):
+        html = '<table><tr><th>verleden tijd</th><td>las</td></tr>' \
+               '<tr><th>voltooid deelwoord</th><td>gelezen</td></tr></table>'
+        responses = {'https://nl.wiktionary.org/wiki/': html}
+
+        result = self.run_lookup(responses, None)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result['forms']['past_tense'], 'las')
+        self.assertEqual(result['forms']['past_participle'], 'gelezen')
+
+
+class ProcessStreamTest(unittest.TestCase):
+    """Only words that were actually looked up are saved for resuming."""
+
+    def setUp(self):
+        with mock.patch.object(dutch_word_analyzer, 'CACHE_FILE', ':memory:'):
+            self.analyzer = DutchWordAnalyzer()
+
+    def test_failed_lookup_is_not_saved(self):
+        async def fake_get(client, url, as_json=True, data=None):
+            if url.endswith('/groot'):
+                raise httpx.ConnectError('connection refused')
+            if url == DEFINITION_API + 'lezen':
+                return DEFINITION
+            return None
+
+        outfh = io.BytesIO()
+        with mock.patch.object(self.analyzer, '_get', side_effect=fake_get):
+            results = asyncio.run(self.analyzer._process_stream(iter(['lezen', 'groot']), outfh))
+
+        self.assertEqual([r['word'] for r in results], ['lezen', 'groot'])
+        self.assertNotIn('_failed', results[1])
+        saved = [orjson.loads(line)['word'] for line in outfh.getvalue().splitlines()]
+        self.assertEqual(saved, ['lezen'])
+
+
+class IsJsonlFileTest(unittest.TestCase):
+    """Only JSON Lines output files are resumed."""
+
+    def setUp(self):
+        with mock.patch.object(dutch_word_analyzer, 'CACHE_FILE', ':memory:'):
+            self.analyzer = DutchWordAnalyzer()
+
+    def check(self, content):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'output.json'
+            if content is not None:
+                path.write_bytes(content)
+            return DutchWordAnalyzer._is_jsonl_file(str(path))
+
+    def test_jsonl_files_are_accepted(self):
+        self.assertTrue(self.check(None))
+        self.assertTrue(self.check(b''))
+        self.assertTrue(self.check(b'{"word":"lezen"}\n{"word":"groo'))
+        self.assertTrue(self.check(b'{"word":"le'))
+
+    def test_json_array_is_refused(self):
+        self.assertFalse(self.check(b'[\n  {\n    "word": "lezen"\n  }\n]'))
+        self.assertFalse(self.check(b'[{"word": "lezen"}]'))
+
+    def test_json_array_file_is_left_untouched(self):
+        content = b'[\n  {\n    "word": "lezen"\n  }\n]'
+        with tempfile.TemporaryDirectory() as tmp:
+            words = Path(tmp) / 'words.txt'
+            words.write_text('lezen\n', encoding='utf-8')
+            output = Path(tmp) / 'output.json'
+            output.write_bytes(content)
+            with mock.patch('sys.stderr', io.StringIO()):
+                results = self.analyzer.process_words_from_file(str(words), str(output))
+            self.assertEqual(results, [])
+            self.assertEqual(output.read_bytes(), content)
+
+
+class FinalizeWordInfoTest(unittest.TestCase):
+    """Finalized results always carry the same form keys."""
+
+    def test_partial_forms_get_the_full_key_set(self):
+        word_info = {'word': 'lopen', 'meanings': [], 'word_type': 'verb',
+                     'forms': {'past_tense': 'liep', 'past_participle': 'gelopen'}}
+
+        forms = dutch_word_analyzer._finalize_word_info('lopen', word_info)['forms']
+
+        self.assertEqual(list(forms), list(dutch_word_analyzer._FORM_NAMES))
+        self.assertEqual(forms['past_tense'], 'liep')
+        self.assertIsNone(forms['plural'])
+        self.assertIsNone(forms['superlative'])
+
+
+class TruncatePartialLineTest(unittest.TestCase):
+    """Resuming drops a JSON line cut short by an interrupted run."""
+
+    def write_and_truncate(self, content):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'output.jsonl'
+            path.write_bytes(content)
+            DutchWordAnalyzer._truncate_partial_line(str(path))
+            return path.read_bytes()
+
+    def test_partial_last_line_is_removed(self):
+        content = b'{"word":"lezen"}\n{"word":"groo'
+        self.assertEqual(self.write_and_truncate(content), b'{"word":"lezen"}\n')
+
+    def test_complete_file_is_unchanged(self):
+        content = b'{"word":"lezen"}\n{"word":"groot"}\n'
+        self.assertEqual(self.write_and_truncate(content), content)
+
+    def test_single_partial_line_is_removed(self):
+        self.assertEqual(self.write_and_truncate(b'{"word":"le'), b'')
+
+
+if __name__ == '__main__':
+    unittest.main()